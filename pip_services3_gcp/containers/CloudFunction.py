@@ -20,6 +20,7 @@ from pip_services3_container import Container
 from pip_services3_rpc.services import InstrumentTiming
 
 from .CloudFunctionRequestHelper import CloudFunctionRequestHelper
+from .CloudFunctionSchemaHelper import CloudFunctionSchemaHelper
 
 
 class CloudFunction(Container, ABC):
@@ -224,13 +225,21 @@ class CloudFunction(Container, ABC):
             raise UnknownException(
                 None, 'DUPLICATED_ACTION', f'"{cmd}" action already exists')
 
+        # Without schema there is nothing to validate, so the action is registered as is
+        if not schema:
+            self._actions[cmd] = action
+            return
+
+        # Schema is compiled once at registration
+        is_valid = CloudFunctionSchemaHelper.compile_schema(schema)
+
         # Hack!!! Wrapping action to preserve prototyping context
         def action_curl(req: flask.Request):
             # Perform validation
-            if schema:
-                params = req.args.to_dict()
-                params.update({'body': req.json})
+            params = {**req.args, 'body': CloudFunctionRequestHelper.get_body(req)}
 
+            # Perform full validation only when compiled check can't confirm the params
+            if not is_valid(params):
                 correlation_id = self._get_correlation_id(req)
                 err = schema.validate_and_return_exception(
                     correlation_id, params, False)
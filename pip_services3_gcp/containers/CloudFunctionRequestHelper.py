@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from typing import Any
+
 import flask
 from pip_services3_commons.run import Parameters
 
@@ -19,7 +21,7 @@ class CloudFunctionRequestHelper:
         correlation_id = req.view_args.get('correlation_id', '')
         try:
             if correlation_id == '' and req.is_json:
-                correlation_id = req.json.get('correlation_id', '')
+                correlation_id = CloudFunctionRequestHelper.get_body(req).get('correlation_id', '')
                 if correlation_id == '':
                     correlation_id = req.args.get('correlation_id', '')
         except Exception as e:
@@ -39,7 +41,7 @@ class CloudFunctionRequestHelper:
         cmd = req.view_args.get('cmd', '')
         try:
             if cmd == '' and req.is_json:
-                cmd = req.json.get('cmd', '')
+                cmd = CloudFunctionRequestHelper.get_body(req).get('cmd', '')
                 if cmd == '':
                     cmd = req.args.get('cmd', '')
         except Exception as e:
@@ -48,6 +50,29 @@ class CloudFunctionRequestHelper:
 
         return cmd
 
+    @staticmethod
+    def get_body(req: flask.Request) -> Any:
+        """
+        Returns parsed JSON body from Google Function request.
+        The body is parsed once and cached on the request object,
+        so subsequent calls return the same value.
+
+        :param req: the Google Function request (flask object request)
+        :return: returns parsed body or None if request has no JSON content
+        """
+        try:
+            return req._pip_body
+        except AttributeError:
+            pass
+
+        body = None
+        # Parsing goes through the application JSON provider, which keeps big integers exact
+        if req.is_json and req.get_data(cache=True):
+            body = req.get_json(cache=True)
+
+        req._pip_body = body
+        return body
+
     @staticmethod
     def get_parameters(req: flask.Request) -> Parameters:
         """
@@ -59,7 +84,7 @@ class CloudFunctionRequestHelper:
         body = req
         try:
             if req.is_json:
-                body = req.get_json()
+                body = CloudFunctionRequestHelper.get_body(req)
         except Exception as e:
             # Ignore the error
             pass
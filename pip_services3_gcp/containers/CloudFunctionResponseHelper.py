@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import json
+from typing import Any, Union
+
+import flask
+import orjson
+from pip_services3_commons.data import DataPage
+
+# Response types returned to Flask as is
+_PASSTHROUGH_TYPES = (int, str, dict, tuple, list, bytes, float, flask.Response)
+
+# Non-string keys are written as strings like json module does
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class CloudFunctionResponseHelper:
+    """
+    Class that helps to prepare function responses
+    """
+
+    # Headers of responses with JSON content
+    JSON_HEADERS = {'Content-Type': 'application/json'}
+
+    @staticmethod
+    def to_json_default(obj: Any) -> Any:
+        """
+        Converts objects unknown to orjson into serializable values
+        the same way JsonConverter does.
+
+        :param obj: an object to convert
+        :return: a value that can be serialized by orjson
+        """
+        if isinstance(obj, (set, frozenset)):
+            return list(obj)
+        if hasattr(obj, 'to_dict'):
+            return obj.to_dict()
+        if hasattr(obj, 'isoformat'):
+            return obj.isoformat()
+        if hasattr(obj, 'to_json'):
+            return obj.to_json()
+        obj_dict = getattr(obj, '__dict__', None)
+        if obj_dict is None:
+            return str(obj)
+        return {k: v for k, v in obj_dict.items() if not (k.startswith('__') and k.endswith('__'))}
+
+    @staticmethod
+    def serialize(value: Any) -> bytes:
+        """
+        Serializes a value into JSON.
+
+        :param value: a value to serialize
+        :return: JSON encoded into bytes
+        """
+        try:
+            return orjson.dumps(value, default=CloudFunctionResponseHelper.to_json_default, option=_JSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # orjson can't encode integers beyond 64 bits, json module has no such limit
+            return json.dumps(value, default=CloudFunctionResponseHelper.to_json_default).encode()
+
+    @staticmethod
+    def to_response_format(res: Any) -> Union[dict, tuple]:
+        """
+        Converts action result into a value that can be returned to Flask.
+
+        :param res: an action result
+        :return: a response value
+        """
+        if res is None:
+            return '', 204
+        if isinstance(res, _PASSTHROUGH_TYPES):
+            return res
+
+        to_dict = getattr(res, 'to_dict', None)
+        if to_dict is not None:
+            return to_dict()
+
+        to_json = getattr(res, 'to_json', None)
+        if to_json is not None:
+            if isinstance(res, DataPage):
+                # Serialize page items directly without an intermediate dict round-trip
+                return CloudFunctionResponseHelper.serialize(to_json()), 200, CloudFunctionResponseHelper.JSON_HEADERS
+            return to_json()
+
+        # Dataclasses, datetimes and UUIDs are handled natively by orjson
+        return CloudFunctionResponseHelper.serialize(res).decode()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Callable
+
+from pip_services3_commons.convert import TypeCode
+from pip_services3_commons.validate import Schema, ObjectSchema
+
+
+def _compile_type_check(typ: Any) -> Callable[[Any], bool]:
+    # Returns a check that is true only when a value definitely matches the property type
+    if typ is None:
+        return lambda value: True
+
+    if isinstance(typ, Schema):
+        return CloudFunctionSchemaHelper.compile_schema(typ)
+
+    if typ == TypeCode.String:
+        return lambda value: value is None or type(value) is str
+
+    # Other types are checked by the schema itself, only a missing value is known to be valid
+    return lambda value: value is None
+
+
+class CloudFunctionSchemaHelper:
+    """
+    Class that helps to validate function requests
+    """
+
+    @staticmethod
+    def compile_schema(schema: Schema) -> Callable[[Any], bool]:
+        """
+        Compiles a validation schema into a fast check that is executed on every request.
+        The check returns true only when the value is known to pass validation,
+        otherwise the full schema validation shall be performed.
+        It covers plain object schemas with string and nested object properties,
+        any other schema is checked only for a missing value.
+
+        :param schema: a validation schema to compile
+        :return: a function that checks a value
+        """
+        required = schema.is_required()
+
+        if not isinstance(schema, ObjectSchema) or schema.get_rules() \
+                or type(schema)._perform_validation is not ObjectSchema._perform_validation:
+            return lambda value: value is None and not required
+
+        properties = []
+        for property_schema in schema.get_properties() or []:
+            if property_schema.get_rules():
+                type_check = lambda value: value is None
+            else:
+                type_check = _compile_type_check(property_schema.get_type())
+            properties.append((property_schema.get_name(), property_schema.is_required(), type_check))
+
+        names = frozenset(name for name, _, _ in properties)
+        allow_undefined = schema.is_undefined_allowed
+
+        def check(value: Any) -> bool:
+            if value is None:
+                return not required
+            if type(value) is not dict:
+                return False
+            if not allow_undefined and not names.issuperset(value):
+                return False
+
+            for name, property_required, type_check in properties:
+                property_value = value.get(name)
+                if property_value is None and property_required:
+                    return False
+                if not type_check(property_value):
+                    return False
+
+            return True
+
+        return check
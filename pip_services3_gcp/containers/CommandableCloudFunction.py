@@ -1,17 +1,13 @@
 # -*- coding: utf-8 -*-
-import json
-from typing import Union, Any
-
 import flask
 
 from pip_services3_commons.commands import CommandSet, ICommandable
-from pip_services3_commons.convert import JsonConverter
-from pip_services3_commons.data import DataPage
 from pip_services3_commons.run import Parameters
 from pip_services3_rpc.services import HttpResponseSender
 
 from .CloudFunction import CloudFunction
 from .CloudFunctionRequestHelper import CloudFunctionRequestHelper
+from .CloudFunctionResponseHelper import CloudFunctionResponseHelper
 
 
 class CommandableCloudFunction(CloudFunction):
@@ -67,25 +63,31 @@ class CommandableCloudFunction(CloudFunction):
         return CloudFunctionRequestHelper.get_parameters(req)
 
     def __register_command_set(self, command_set: CommandSet):
-        commands = command_set.get_commands()
-        for i in range(len(commands)):
-            command = commands[i]
-
+        for command in command_set.get_commands():
             def wrapper(command):
+                # Method name and helpers are bound once at registration
+                full_name = self._info.name + '.' + command.get_name()
+                execute = command.execute
+                get_correlation_id = self._get_correlation_id
+                get_parameters = self._get_parameters
+                instrument = self._instrument
+                to_response_format = CloudFunctionResponseHelper.to_response_format
+                compose_error = self._compose_error
+
                 # wrapper for passing context
                 def action(req: flask.Request):
-                    correlation_id = self._get_correlation_id(req)
-                    args = self._get_parameters(req)
-                    timing = self._instrument(correlation_id, self._info.name + '.' + command.get_name())
+                    correlation_id = get_correlation_id(req)
+                    args = get_parameters(req)
+                    timing = instrument(correlation_id, full_name)
 
                     try:
-                        result = command.execute(correlation_id, args)
+                        result = execute(correlation_id, args)
                         # Conversion to response data format
-                        result = self.__to_response_format(result)
+                        result = to_response_format(result)
                         return result
                     except Exception as e:
                         timing.end_failure(e)
-                        return self._compose_error(e)
+                        return compose_error(e)
                     finally:
                         timing.end_timing()
 
@@ -100,18 +102,3 @@ class CommandableCloudFunction(CloudFunction):
         controller: ICommandable = self._dependency_resolver.get_one_required('controller')
         command_set = controller.get_command_set()
         self.__register_command_set(command_set)
-
-    def __to_response_format(self, res: Any) -> Union[dict, tuple]:
-        if res is None:
-            return '', 204
-        if not isinstance(res, (int, str, dict, tuple, list, bytes, float, flask.Response)):
-            if hasattr(res, 'to_dict'):
-                res = res.to_dict()
-            elif hasattr(res, 'to_json'):
-                if isinstance(res, DataPage) and len(res.data) > 0 and not isinstance(res.data[0], dict):
-                    res.data = json.loads(JsonConverter.to_json(res.data))
-                res = res.to_json()
-            else:
-                res = JsonConverter.to_json(res)
-
-        return res
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 
-__all__ = ['CloudFunctionRequestHelper', 'CloudFunction', 'CommandableCloudFunction']
+__all__ = ['CloudFunctionRequestHelper', 'CloudFunctionResponseHelper', 'CloudFunctionSchemaHelper',
+           'CloudFunction', 'CommandableCloudFunction']
 
 from .CloudFunctionRequestHelper import CloudFunctionRequestHelper
+from .CloudFunctionResponseHelper import CloudFunctionResponseHelper
+from .CloudFunctionSchemaHelper import CloudFunctionSchemaHelper
 from .CloudFunction import CloudFunction
 from .CommandableCloudFunction import CommandableCloudFunction
@@ -6,6 +6,7 @@ from pip_services3_commons.validate import Schema
 
 
 class CloudFunctionAction:
+    __slots__ = ('cmd', 'schema', 'action')
 
     def __init__(self, cmd: str = None, schema: Schema = None, action: Callable[[flask.Request], Any] = None):
         # Command to call the action
@@ -14,9 +15,10 @@ class CloudFunctionAction:
         # Schema to validate action parameters
         self.schema: Schema = schema
 
-        self.action = action if action else self.action
+        # Action to be executed
+        self.action: Callable[[flask.Request], Any] = action if action else self._default_action
 
-    def action(self, request: flask.Request) -> Any:
+    def _default_action(self, request: flask.Request) -> Any:
         """
         Action to be executed
         """
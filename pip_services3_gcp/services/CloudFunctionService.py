@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
+import functools
 import re
+import sys
 import traceback
 from abc import abstractmethod
-from typing import List, Optional, Callable, Any
+from typing import List, Optional, Callable, Any, Dict
 
 import flask
 from pip_services3_commons.config import IConfigurable, ConfigParams
-from pip_services3_commons.convert import JsonConverter
 from pip_services3_commons.errors import ErrorDescriptionFactory
 from pip_services3_commons.refer import DependencyResolver, IReferenceable, IReferences
 from pip_services3_commons.run import IOpenable
@@ -19,6 +20,25 @@ from pip_services3_rpc.services import InstrumentTiming
 from .CloudFunctionAction import CloudFunctionAction
 from .ICloudFunctionService import ICloudFunctionService
 from ..containers.CloudFunctionRequestHelper import CloudFunctionRequestHelper
+from ..containers.CloudFunctionResponseHelper import CloudFunctionResponseHelper
+from ..containers.CloudFunctionSchemaHelper import CloudFunctionSchemaHelper
+
+# Default values for error fields that are missing in the composed error
+_BASIC_FILLERS = {'code': 'Undefined', 'status': 500, 'message': 'Unknown error',
+                  'name': None, 'details': None,
+                  'component': None, 'stack': None, 'cause': None}
+
+# Error used when no error object is passed to _compose_error
+_DefaultError = type('error', (object,), _BASIC_FILLERS)
+
+
+@functools.lru_cache(maxsize=256)
+def _make_action_cmd(service_name: Optional[str], name: str) -> str:
+    # Generates action command prefixed with the service name
+    if service_name is not None:
+        return service_name + '.' + name
+
+    return name
 
 
 class CloudFunctionService(ICloudFunctionService, IOpenable, IConfigurable, IReferenceable):
@@ -90,6 +110,7 @@ class CloudFunctionService(ICloudFunctionService, IOpenable, IConfigurable, IRef
         """
         self.__name: str = name
         self.__actions: List[CloudFunctionAction] = []
+        self.__actions_by_cmd: Dict[str, CloudFunctionAction] = {}
         self.__interceptors: List[Callable[[flask.Request, Callable[[flask.Request], Any]], Any]] = []
         self.__opened: bool = False
 
@@ -127,11 +148,21 @@ class CloudFunctionService(ICloudFunctionService, IOpenable, IConfigurable, IRef
     def get_actions(self) -> List[CloudFunctionAction]:
         """
         Get all actions supported by the service.
+        The returned list is owned by the service and is cleared in place when it is closed.
 
         :return: an array with supported actions.
         """
         return self.__actions
 
+    def get_action(self, cmd: str) -> Optional[CloudFunctionAction]:
+        """
+        Gets an action registered for the specified command.
+
+        :param cmd: a command name.
+        :return: the registered action or None if the command is not supported.
+        """
+        return self.__actions_by_cmd.get(cmd)
+
     def _instrument(self, correlation_id: Optional[str], name: str) -> InstrumentTiming:
         """
         Adds instrumentation to log calls and measure call time.
@@ -168,6 +199,7 @@ class CloudFunctionService(ICloudFunctionService, IOpenable, IConfigurable, IRef
             return
 
         self.register()
+        self._warm_up()
 
         self.__opened = True
 
@@ -181,25 +213,32 @@ class CloudFunctionService(ICloudFunctionService, IOpenable, IConfigurable, IRef
             return
 
         self.__opened = False
-        self.__actions = []
-        self.__interceptors = []
+        self.__actions.clear()
+        self.__actions_by_cmd.clear()
+        self.__interceptors.clear()
 
     def _apply_validation(self, schema: Schema, action: Callable[[flask.Request], Any]) -> Callable[
             [flask.Request], Any]:
-        # Create an action function
+        # Without schema there is nothing to validate, so the action is used as is
+        if not schema:
+            return action
+
+        # Schema is compiled once at registration
+        is_valid = CloudFunctionSchemaHelper.compile_schema(schema)
 
+        # Create an action function
         def action_wrapper(req: flask.Request):
             # Validate object
-            if schema and req:
-                params = req.args.to_dict()
-                params.update({'body': req.json})
+            if req:
+                params = {**req.args, 'body': CloudFunctionRequestHelper.get_body(req)}
 
-                # Perform validation
-                correlation_id = self._get_correlation_id(req)
-                err = schema.validate_and_return_exception(
-                    correlation_id, params, False)
-                if err is not None:
-                    return self._compose_error(err)
+                # Perform full validation only when compiled check can't confirm the params
+                if not is_valid(params):
+                    correlation_id = self._get_correlation_id(req)
+                    err = schema.validate_and_return_exception(
+                        correlation_id, params, False)
+                    if err is not None:
+                        return self._compose_error(err)
 
             return action(req)
 
@@ -208,20 +247,14 @@ class CloudFunctionService(ICloudFunctionService, IOpenable, IConfigurable, IRef
     def _apply_interceptors(self, action: Callable[[flask.Request], Any]) -> Callable[[flask.Request], Any]:
         action_wrapper = action
 
-        index = len(self.__interceptors) - 1
-        while index >= 0:
-            interceptor = self.__interceptors[index]
-            def action_wrapper(action): return lambda params: interceptor(
-                params, action)(action_wrapper)
+        # Chain is built once at registration: the first registered interceptor is called first
+        for interceptor in reversed(self.__interceptors):
+            action_wrapper = functools.partial(interceptor, next=action_wrapper)
 
         return action_wrapper
 
     def _generate_action_cmd(self, name: str) -> str:
-        cmd = name
-        if self.__name is not None:
-            cmd = self.__name + '.' + cmd
-
-        return cmd
+        return _make_action_cmd(self.__name, name)
 
     def _register_action(self, name: str, schema: Schema, action: Callable[[flask.Request], Any]):
         """
@@ -231,13 +264,15 @@ class CloudFunctionService(ICloudFunctionService, IOpenable, IConfigurable, IRef
         :param schema: a validation schema to validate received parameters.
         :param action: an action function that is called when operation is invoked.
         """
+        cmd = self._generate_action_cmd(name)
+
         action_wrapper = self._apply_validation(schema, action)
         action_wrapper = self._apply_interceptors(action_wrapper)
 
-        register_action: CloudFunctionAction = CloudFunctionAction(self._generate_action_cmd(name), schema,
-                                                                   lambda req: action_wrapper(req))
+        register_action: CloudFunctionAction = CloudFunctionAction(cmd, schema, action_wrapper)
 
         self.__actions.append(register_action)
+        self.__actions_by_cmd[register_action.cmd] = register_action
 
     def _register_action_with_auth(self, name: str, schema: Schema,
                                    authorize: Callable[[Any, Callable[[Any], Any]], Any], action: Callable[[Any], Any]):
@@ -249,17 +284,20 @@ class CloudFunctionService(ICloudFunctionService, IOpenable, IConfigurable, IRef
         :param authorize: an authorization interceptor
         :param action: an action function that is called when operation is invoked.
         """
-        action_wrapper = self._apply_validation(schema, action)
+        cmd = self._generate_action_cmd(name)
+
+        validated_action = self._apply_validation(schema, action)
 
         # Add authorization just before validation
-        action_wrapper = lambda req: authorize(req, action_wrapper)
+        def action_wrapper(req: flask.Request):
+            return authorize(req, validated_action)
 
         action_wrapper = self._apply_interceptors(action_wrapper)
 
-        register_action: CloudFunctionAction = CloudFunctionAction(self._generate_action_cmd(name), schema,
-                                                                   lambda req: action_wrapper(req))
+        register_action: CloudFunctionAction = CloudFunctionAction(cmd, schema, action_wrapper)
 
         self.__actions.append(register_action)
+        self.__actions_by_cmd[register_action.cmd] = register_action
 
     def _register_interceptor(self, cmd: str, action: Callable[[flask.Request], Any]):
         """
@@ -279,6 +317,14 @@ class CloudFunctionService(ICloudFunctionService, IOpenable, IConfigurable, IRef
 
         self.__interceptors.append(intercept_wrapper)
 
+    def _warm_up(self):
+        """
+        Prepares the service to handle requests after its actions are registered.
+        This method is called when the service is opened and can be overriden
+        in child classes to run expensive one-time initialization, like compiling
+        JIT functions with representative inputs, before the first request comes in.
+        """
+
     @abstractmethod
     def register(self):
         """
@@ -315,19 +361,18 @@ class CloudFunctionService(ICloudFunctionService, IOpenable, IConfigurable, IRef
         :param error: an error object to be sent.
         :return: HTTP response
         """
-        basic_fillers = {'code': 'Undefined', 'status': 500, 'message': 'Unknown error',
-                         'name': None, 'details': None,
-                         'component': None, 'stack': None, 'cause': None}
-
         if error is None:
-            error = type('error', (object,), basic_fillers)
+            error = _DefaultError
         else:
-            for k, v in basic_fillers.items():
+            for k, v in _BASIC_FILLERS.items():
                 error.__dict__[k] = v if error.__dict__.get(
                     k) is None else error.__dict__[k]
 
-        headers = {'Content-Type': 'application/json'}
         error = ErrorDescriptionFactory.create(error)
-        error.stack_trace = traceback.format_exc()
+        # Format stack trace only when called while handling an exception
+        error.stack_trace = traceback.format_exc() if sys.exc_info()[0] is not None else None
+
+        # Serialized bytes are sent as is, without re-encoding
+        body = CloudFunctionResponseHelper.serialize(error)
 
-        return flask.Response(JsonConverter.to_json(error), status=error.status, headers=headers)
+        return flask.Response(body, status=error.status, headers=CloudFunctionResponseHelper.JSON_HEADERS)
@@ -1,15 +1,10 @@
 # -*- coding: utf-8 -*-
-import json
 import flask
 
-from typing import Any, Union
-
-from pip_services3_commons.data import DataPage
-from pip_services3_commons.convert import JsonConverter
 from pip_services3_commons.commands import CommandSet, ICommandable
 from pip_services3_commons.run import Parameters
 
-from pip_services3_gcp.containers import CloudFunctionRequestHelper
+from pip_services3_gcp.containers import CloudFunctionRequestHelper, CloudFunctionResponseHelper
 from pip_services3_gcp.services import CloudFunctionService
 
 
@@ -82,48 +77,40 @@ class CommandableCloudFunctionService(CloudFunctionService):
         """
 
         def wrapper(command):
+            # Method name and helpers are bound once at registration,
+            # not taken from the loop variable on every call
+            name = command.get_name()
+            execute = command.execute
+            get_correlation_id = self._get_correlation_id
+            instrument = self._instrument
+            to_response_format = CloudFunctionResponseHelper.to_response_format
+            compose_error = self._compose_error
+
             # wrapper for passing context
             def action(req: flask.Request):
-                correlation_id = self._get_correlation_id(req)
+                correlation_id = get_correlation_id(req)
 
-                args = Parameters.from_value({} if not req.is_json else req.get_json())
+                args = Parameters.from_value({} if not req.is_json else CloudFunctionRequestHelper.get_body(req))
                 if correlation_id:
                     args.remove('correlation_id')
 
-                timing = self._instrument(correlation_id, name)
+                timing = instrument(correlation_id, name)
                 try:
-                    result = command.execute(correlation_id, args)
+                    result = execute(correlation_id, args)
                     # Conversion to response data format
-                    result = self.__to_response_format(result)
+                    result = to_response_format(result)
                     timing.end_timing()
                     return result
                 except Exception as e:
                     timing.end_failure(e)
-                    return self._compose_error(e)
+                    return compose_error(e)
 
             return action
 
         controller: ICommandable = self._dependency_resolver.get_one_required('controller')
         self.__command_set = controller.get_command_set()
 
-        commands = self.__command_set.get_commands()
-        for index in range(len(commands)):
-            command = commands[index]
+        for command in self.__command_set.get_commands():
             name = command.get_name()
 
             self._register_action(name, None, wrapper(command))
-
-    def __to_response_format(self, res: Any) -> Union[dict, tuple]:
-        if res is None:
-            return '', 204
-        if not isinstance(res, (int, str, dict, tuple, list, bytes, float, flask.Response)):
-            if hasattr(res, 'to_dict'):
-                res = res.to_dict()
-            elif hasattr(res, 'to_json'):
-                if isinstance(res, DataPage) and len(res.data) > 0 and not isinstance(res.data[0], dict):
-                    res.data = json.loads(JsonConverter.to_json(res.data))
-                res = res.to_json()
-            else:
-                res = JsonConverter.to_json(res)
-
-        return res
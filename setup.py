@@ -13,6 +13,8 @@ Links
 
 """
 
+import os
+
 from setuptools import setup
 from setuptools import find_packages
 
@@ -21,6 +23,23 @@ try:
 except:
     readme = __doc__
 
+# Optionally compile request hot paths with Cython.
+# Enabled by PIP_SERVICES_CYTHONIZE=1; pure Python modules are used otherwise.
+ext_modules = []
+if os.environ.get('PIP_SERVICES_CYTHONIZE') == '1':
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            'pip_services3_gcp/services/CloudFunctionService.py',
+            'pip_services3_gcp/services/CommandableCloudFunctionService.py',
+            'pip_services3_gcp/containers/CloudFunctionResponseHelper.py',
+            'pip_services3_gcp/containers/CloudFunctionSchemaHelper.py',
+            'pip_services3_gcp/containers/CommandableCloudFunction.py'
+        ],
+        compiler_directives={'language_level': '3', 'annotation_typing': False}
+    )
+
 setup(
     name='pip_services3_gcp',
     version='3.0.4',
@@ -32,11 +51,13 @@ setup(
     long_description=readme,
     long_description_content_type="text/markdown",
     packages=find_packages(exclude=['config', 'data', 'test']),
+    ext_modules=ext_modules,
     include_package_data=True,
-    zip_safe=True,
+    zip_safe=not ext_modules,
     platforms='any',
     install_requires=[
         'Flask >= 2.0.3, < 3.0',
+        'orjson >= 3.6.1, < 4.0',
 
         'pip_services3_commons >=3.3.14, <4.0',
         'pip_services3_components >=3.5.9, <4.0',
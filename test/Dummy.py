@@ -5,12 +5,22 @@ from pip_services3_commons.data import IStringIdentifiable
 
 
 class Dummy(IStringIdentifiable):
+    __slots__ = ('id', 'key', 'content')
 
     def __init__(self, id: Optional[str], key: str, content: str):
         self.id = id
         self.key = key
         self.content = content
 
+    @classmethod
+    def from_dict(cls, value: dict) -> 'Dummy':
+        # Assigns fields directly without unpacking the dict into keyword arguments
+        dummy = cls.__new__(cls)
+        dummy.id = value.get('id')
+        dummy.key = value.get('key')
+        dummy.content = value.get('content')
+        return dummy
+
     def to_dict(self) -> dict:
         return {
             'id': self.id,
@@ -9,10 +9,16 @@ from pip_services3_commons.validate import ObjectSchema, FilterParamsSchema, Pag
 
 from .Dummy import Dummy
 from .DummySchema import DummySchema
+from .DummySerialization import serialize_page
 from .IDummyController import IDummyController
 
 
 class DummyCommandSet(CommandSet):
+    # Command schemas are immutable, so they are built once and shared by all command sets
+    _GET_DUMMIES_SCHEMA = ObjectSchema(True).with_optional_property("filter", FilterParamsSchema()) \
+        .with_optional_property("paging", PagingParamsSchema())
+    _DUMMY_ID_SCHEMA = ObjectSchema(True).with_required_property("dummy_id", TypeCode.String)
+    _DUMMY_SCHEMA = ObjectSchema(True).with_required_property("dummy", DummySchema())
 
     def __init__(self, controller: IDummyController):
         super(DummyCommandSet, self).__init__()
@@ -31,20 +37,11 @@ class DummyCommandSet(CommandSet):
             paging = PagingParams.from_value(args.get("paging"))
             page = self.__controller.get_page_by_filter(correlation_id, filter, paging)
 
-            if len(page.data) > 0:
-                serealized_items = []
-                for item in page.data:
-                    serealized_items.append(item.to_dict())
-
-                page = page.to_json()
-                page['data'] = serealized_items
-
-            return page
+            return serialize_page(page)
 
         return Command(
             "get_dummies",
-            ObjectSchema(True).with_optional_property("filter", FilterParamsSchema())
-                .with_optional_property("paging", PagingParamsSchema()),
+            DummyCommandSet._GET_DUMMIES_SCHEMA,
             command_func
         )
 
@@ -58,13 +55,14 @@ class DummyCommandSet(CommandSet):
 
         return Command(
             "get_dummy_by_id",
-            ObjectSchema(True).with_required_property("dummy_id", TypeCode.String),
+            DummyCommandSet._DUMMY_ID_SCHEMA,
             command_func
         )
 
     def __make_create_command(self) -> ICommand:
         def command_func(correlation_id: Optional[str], args: Parameters):
-            entity: Dummy = None if 'dummy' not in args.keys() else Dummy(**args['dummy'])
+            dummy = args.get('dummy')
+            entity: Dummy = None if dummy is None else Dummy.from_dict(dummy)
             res: Dummy = self.__controller.create(correlation_id, entity)
             if res:
                 return res.to_dict()
@@ -72,13 +70,14 @@ class DummyCommandSet(CommandSet):
 
         return Command(
             "create_dummy",
-            ObjectSchema(True).with_required_property("dummy", DummySchema()),
+            DummyCommandSet._DUMMY_SCHEMA,
             command_func
         )
 
     def __make_update_command(self) -> ICommand:
         def command_func(correlation_id: Optional[str], args: Parameters):
-            entity: Dummy = None if 'dummy' not in args.keys() else Dummy(**args['dummy'])
+            dummy = args.get('dummy')
+            entity: Dummy = None if dummy is None else Dummy.from_dict(dummy)
             res = self.__controller.update(correlation_id, entity)
             if res:
                 return res.to_dict()
@@ -86,7 +85,7 @@ class DummyCommandSet(CommandSet):
 
         return Command(
             "update_dummy",
-            ObjectSchema(True).with_required_property("dummy", DummySchema()),
+            DummyCommandSet._DUMMY_SCHEMA,
             command_func
         )
 
@@ -100,6 +99,6 @@ class DummyCommandSet(CommandSet):
 
         return Command(
             "delete_dummy",
-            ObjectSchema(True).with_required_property("dummy_id", TypeCode.String),
+            DummyCommandSet._DUMMY_ID_SCHEMA,
             command_func
         )
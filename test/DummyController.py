@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
-from typing import List, Optional
+import bisect
+import itertools
+from collections import defaultdict, OrderedDict
+from typing import List, Optional, Dict, Tuple
 
 from pip_services3_commons.commands import ICommandable, CommandSet
 from pip_services3_commons.data import FilterParams, PagingParams, DataPage, IdGenerator
@@ -9,11 +12,19 @@ from .DummyCommandSet import DummyCommandSet
 from .IDummyController import IDummyController
 
 
+# Paging is only read here, so a single default instance is shared
+_DEFAULT_PAGING = PagingParams()
+
+
 class DummyController(IDummyController, ICommandable):
 
     def __init__(self):
         self.__command_set: DummyCommandSet = None
-        self.__entities: List[Dummy] = []
+        self.__entities: 'OrderedDict[str, Dummy]' = OrderedDict()
+        # Buckets hold (creation sequence, id) pairs, so they stay in creation order
+        self.__entities_by_key: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        self.__sequences: Dict[str, int] = {}
+        self.__next_sequence = itertools.count()
 
     def get_command_set(self) -> CommandSet:
         if self.__command_set is None:
@@ -22,59 +33,56 @@ class DummyController(IDummyController, ICommandable):
 
     def get_page_by_filter(self, correlation_id: Optional[str], filter_params: FilterParams,
                            paging: PagingParams) -> DataPage:
-        filter = filter_params if filter_params is not None else None
-        key = filter.get_as_nullable_string("key")
+        key = None if filter_params is None else filter_params.get_as_nullable_string("key")
 
-        paging = paging if paging is not None else PagingParams()
+        paging = paging if paging is not None else _DEFAULT_PAGING
         skip: int = paging.get_skip(0)
         take: int = paging.get_take(100)
 
-        result: List[Dummy] = []
-        for i in range(len(self.__entities)):
-            entity = self.__entities[i]
-            if key is not None and key != entity.key:
-                continue
-
-            skip -= 1
-            if skip >= 0:
-                continue
+        if take <= 0 or not self.__entities:
+            return DataPage([])
 
-            take -= 1
-            if take < 0:
-                break
+        if key is None:
+            return DataPage(list(itertools.islice(self.__entities.values(), skip, skip + take)))
 
-            result.append(entity)
-
-        return DataPage(result)
+        bucket = self.__entities_by_key.get(key, [])
+        return DataPage([self.__entities[id] for _, id in bucket[skip:skip + take]])
 
     def get_one_by_id(self, correlation_id: Optional[str], id: str) -> Optional[Dummy]:
-        for entity in self.__entities:
-            if id == entity.id:
-                return entity
-
-        return None
+        return self.__entities.get(id)
 
     def create(self, correlation_id: Optional[str], entity: Dummy) -> Dummy:
         if entity.id is None:
             entity.id = IdGenerator.next_long()
-            self.__entities.append(entity)
+            self.__entities[entity.id] = entity
+            self.__sequences[entity.id] = next(self.__next_sequence)
+            self.__entities_by_key[entity.key].append((self.__sequences[entity.id], entity.id))
 
         return entity
 
     def update(self, correlation_id: Optional[str], new_entity: Dummy) -> Optional[Dummy]:
-        for index in range(len(self.__entities)):
-            entity = self.__entities[index]
-            if entity.id == new_entity.id:
-                self.__entities[index] = new_entity
-                return new_entity
+        entity = self.__entities.get(new_entity.id)
+        if entity is None:
+            return None
 
-        return None
+        self.__entities[new_entity.id] = new_entity
+
+        if entity.key != new_entity.key:
+            self.__remove_from_key_index(entity)
+            bisect.insort(self.__entities_by_key[new_entity.key], (self.__sequences[entity.id], entity.id))
+
+        return new_entity
 
     def delete_by_id(self, correlation_id: Optional[str], id: str) -> Optional[Dummy]:
-        for index in range(len(self.__entities)):
-            entity = self.__entities[index]
-            if entity.id == id:
-                del self.__entities[index]
-                return entity
+        entity = self.__entities.pop(id, None)
+        if entity is not None:
+            self.__remove_from_key_index(entity)
+            del self.__sequences[id]
+
+        return entity
 
-        return None
+    def __remove_from_key_index(self, entity: Dummy):
+        bucket = self.__entities_by_key[entity.key]
+        del bucket[bisect.bisect_left(bucket, (self.__sequences[entity.id], entity.id))]
+        if not bucket:
+            del self.__entities_by_key[entity.key]
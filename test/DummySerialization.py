@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+from pip_services3_commons.data import DataPage
+
+
+def serialize_page(page: DataPage) -> dict:
+    # Converts page of dummies into JSON-compatible dict
+    result = page.to_json()
+    result['data'] = [item.to_dict() for item in page.data]
+    return result
@@ -9,6 +9,7 @@ from pip_services3_gcp.containers import CloudFunction
 from ..Dummy import Dummy
 from ..DummyFactory import DummyFactory
 from ..DummySchema import DummySchema
+from ..DummySerialization import serialize_page
 from ..IDummyController import IDummyController
 
 
@@ -34,15 +35,7 @@ class DummyCloudFunction(CloudFunction):
             PagingParams(params.get('paging'))
         )
 
-        if len(page.data) > 0:
-            serealized_items = []
-            for item in page.data:
-                serealized_items.append(item.to_dict())
-
-            page = page.to_json()
-            page['data'] = serealized_items
-
-        return page
+        return serialize_page(page)
 
     def __get_one_by_id(self, req: flask.Request):
         params = req.get_json()
@@ -62,7 +55,7 @@ class DummyCloudFunction(CloudFunction):
 
         dummy = self._controller.create(
             self._get_correlation_id(req),
-            Dummy(**params.get('dummy'))
+            Dummy.from_dict(params.get('dummy'))
         )
 
         return dummy.to_dict()
@@ -72,7 +65,7 @@ class DummyCloudFunction(CloudFunction):
 
         dummy = self._controller.update(
             self._get_correlation_id(req),
-            Dummy(**params.get('dummy'))
+            Dummy.from_dict(params.get('dummy'))
         )
 
         return dummy.to_dict()
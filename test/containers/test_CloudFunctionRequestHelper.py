@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import flask
+import pytest
+from werkzeug.exceptions import BadRequest
+
+from pip_services3_gcp.containers import CloudFunctionRequestHelper
+
+app = flask.Flask(__name__)
+
+
+class TestCloudFunctionRequestHelper:
+
+    def test_get_body(self):
+        with app.test_request_context(method='POST', json={'id': 123456789012345678901234, 'name': 'abc'}):
+            body = CloudFunctionRequestHelper.get_body(flask.request)
+            # Integers beyond 64 bits stay exact
+            assert body == {'id': 123456789012345678901234, 'name': 'abc'}
+            assert type(body['id']) is int
+            # The body is parsed once and cached on the request
+            assert CloudFunctionRequestHelper.get_body(flask.request) is body
+
+    def test_get_non_json_body(self):
+        with app.test_request_context(method='POST', data='id=1', content_type='text/plain'):
+            assert CloudFunctionRequestHelper.get_body(flask.request) is None
+
+    def test_get_empty_body(self):
+        with app.test_request_context(method='POST', data='', content_type='application/json'):
+            assert CloudFunctionRequestHelper.get_body(flask.request) is None
+
+    def test_get_malformed_body(self):
+        with app.test_request_context(method='POST', data='{"id": ', content_type='application/json'):
+            with pytest.raises(BadRequest):
+                CloudFunctionRequestHelper.get_body(flask.request)
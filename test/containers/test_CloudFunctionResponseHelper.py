@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import json
+
+from pip_services3_commons.data import DataPage
+
+from pip_services3_gcp.containers import CloudFunctionResponseHelper
+
+
+class Holder:
+    def __init__(self, values):
+        self.values = values
+
+
+class TestCloudFunctionResponseHelper:
+
+    def test_none_result(self):
+        assert CloudFunctionResponseHelper.to_response_format(None) == ('', 204)
+
+    def test_passthrough_result(self):
+        result = {'key': 'value'}
+        assert CloudFunctionResponseHelper.to_response_format(result) is result
+
+    def test_page_with_non_str_keys(self):
+        page = DataPage([{1: 'a'}], 1)
+        body, status, headers = CloudFunctionResponseHelper.to_response_format(page)
+
+        assert status == 200
+        assert headers == CloudFunctionResponseHelper.JSON_HEADERS
+        assert json.loads(body) == {'data': [{'1': 'a'}], 'total': 1}
+
+    def test_page_with_big_int(self):
+        page = DataPage([{'id': 2 ** 70}], 1)
+        body, status, headers = CloudFunctionResponseHelper.to_response_format(page)
+
+        assert status == 200
+        assert json.loads(body) == {'data': [{'id': 2 ** 70}], 'total': 1}
+
+    def test_object_with_non_str_keys(self):
+        result = CloudFunctionResponseHelper.to_response_format(Holder({1: 'a', 2: 'b'}))
+        assert json.loads(result) == {'values': {'1': 'a', '2': 'b'}}
+
+    def test_set_result(self):
+        result = CloudFunctionResponseHelper.to_response_format({1, 2})
+        assert sorted(json.loads(result)) == [1, 2]
+
+        result = CloudFunctionResponseHelper.to_response_format(Holder(frozenset(['a'])))
+        assert json.loads(result) == {'values': ['a']}
+
+    def test_object_with_big_int(self):
+        result = CloudFunctionResponseHelper.to_response_format(Holder(2 ** 70))
+        assert json.loads(result) == {'values': 2 ** 70}
+
+    def test_object_with_nan(self):
+        # orjson writes NaN and Infinity as null, which is valid JSON unlike NaN
+        result = CloudFunctionResponseHelper.to_response_format(Holder([float('nan'), float('inf')]))
+        assert result == '{"values":[null,null]}'
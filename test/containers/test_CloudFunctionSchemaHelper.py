@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+from pip_services3_gcp.containers import CloudFunctionSchemaHelper
+
+from ..services.DummyCloudFunctionService import _GET_DUMMIES_SCHEMA, _GET_DUMMY_BY_ID_SCHEMA, \
+    _DUMMY_SCHEMA, _DELETE_DUMMY_SCHEMA
+
+SCHEMAS = [_GET_DUMMIES_SCHEMA, _GET_DUMMY_BY_ID_SCHEMA, _DUMMY_SCHEMA, _DELETE_DUMMY_SCHEMA]
+
+DUMMY = {'id': '1', 'key': 'Key 1', 'content': 'Content 1'}
+
+PARAMS = [
+    None, {}, 'body', {'body': None}, {'body': {}}, {'body': 'x'}, {'body': []},
+    {'cmd': 'get_dummies', 'body': {'filter': {'key': 'Key 1'}, 'paging': {'skip': 0, 'take': 10}}},
+    {'body': {'filter': 'key=Key 1', 'paging': 5}},
+    {'body': {'dummy_id': '1'}}, {'body': {'dummy_id': 1}}, {'body': {'Dummy_id': 1}},
+    {'body': {'dummy_id': None}}, {'body': {'dummy_id': ['1']}},
+    {'body': {'dummy': DUMMY}}, {'body': {'dummy': {'key': 'Key 1'}}},
+    {'body': {'dummy': {'key': 1}}}, {'body': {'dummy': {'content': 'Content 1'}}},
+    {'body': {'dummy': {**DUMMY, 'extra': 1}}}, {'body': {'dummy': None}},
+    {'body': {'dummy': 'x'}}, {'body': {'dummy': [DUMMY]}},
+]
+
+
+class TestCloudFunctionSchemaHelper:
+
+    def test_compiled_check_matches_validation(self):
+        for schema in SCHEMAS:
+            is_valid = CloudFunctionSchemaHelper.compile_schema(schema)
+            for params in PARAMS:
+                # Compiled check may defer to full validation, but never accepts invalid params
+                if is_valid(params):
+                    assert schema.validate_and_return_exception(None, params, False) is None, params
+
+    def test_compiled_check_accepts_valid_params(self):
+        assert CloudFunctionSchemaHelper.compile_schema(_GET_DUMMY_BY_ID_SCHEMA)({'body': {'dummy_id': '1'}})
+        assert CloudFunctionSchemaHelper.compile_schema(_DELETE_DUMMY_SCHEMA)({'body': {'dummy_id': '1'}})
+        assert CloudFunctionSchemaHelper.compile_schema(_DUMMY_SCHEMA)({'body': {'dummy': DUMMY}})
+
+        assert not CloudFunctionSchemaHelper.compile_schema(_DELETE_DUMMY_SCHEMA)({'body': {}})
+        assert not CloudFunctionSchemaHelper.compile_schema(_DUMMY_SCHEMA)({'body': {'dummy': {'key': 1}}})
@@ -1,139 +1,124 @@
 # -*- coding: utf-8 -*-
+from typing import Any, Callable, Optional
+
 import flask
 from pip_services3_commons.convert import TypeCode
 from pip_services3_commons.data import FilterParams, PagingParams
 from pip_services3_commons.refer import Descriptor, IReferences
 from pip_services3_commons.validate import ObjectSchema, FilterParamsSchema, PagingParamsSchema
 
+from pip_services3_gcp.containers import CloudFunctionRequestHelper
 from pip_services3_gcp.services import CloudFunctionService
 from ..Dummy import Dummy
 from ..DummySchema import DummySchema
+from ..DummySerialization import serialize_page
 from ..IDummyController import IDummyController
 
 
+_CONTROLLER_DESCRIPTOR = Descriptor('pip-services-dummies', 'controller', 'default', '*', '*')
+
+# Headers are an immutable tuple of pairs that Flask accepts as is
+_JSON_HEADERS = (('Content-Type', 'application/json'),)
+
+# Validation schemas are immutable, so they are built once and shared by all service instances
+_GET_DUMMIES_SCHEMA = ObjectSchema(True) \
+    .with_optional_property('body',
+                            ObjectSchema(True)
+                            .with_optional_property('filter', FilterParamsSchema())
+                            .with_optional_property('paging', PagingParamsSchema()))
+
+_GET_DUMMY_BY_ID_SCHEMA = ObjectSchema(True) \
+    .with_optional_property('body',
+                            ObjectSchema(True)
+                            .with_optional_property('dummy_id', TypeCode.String))
+
+# Create and update accept the same body
+_DUMMY_SCHEMA = ObjectSchema(True) \
+    .with_optional_property('body',
+                            ObjectSchema(True)
+                            .with_required_property('dummy', DummySchema()))
+
+_DELETE_DUMMY_SCHEMA = ObjectSchema(True) \
+    .with_optional_property('body',
+                            ObjectSchema(True)
+                            .with_required_property('dummy_id', TypeCode.String))
+
+
 class DummyCloudFunctionService(CloudFunctionService):
     def __init__(self):
         super(DummyCloudFunctionService, self).__init__('dummies')
-        self._dependency_resolver.put('controller',
-                                      Descriptor('pip-services-dummies', 'controller', 'default', '*', '*'))
+        self._dependency_resolver.put('controller', _CONTROLLER_DESCRIPTOR)
 
         self._controller: IDummyController = None
-        self._headers = {
-            'Content-Type': 'application/json'
-        }
+        self.__references: IReferences = None
 
     def set_references(self, references: IReferences):
         super(DummyCloudFunctionService, self).set_references(references)
-        self._controller = self._dependency_resolver.get_one_required('controller')
 
-    def __get_page_by_filter(self, req: flask.Request):
-        params = req.get_json()
+        # Controller is resolved again only when different references are set
+        if references is not self.__references:
+            self._controller = self._dependency_resolver.get_one_required('controller')
+            self.__references = references
 
+    def __get_page_by_filter(self, correlation_id: Optional[str], params: dict):
         page = self._controller.get_page_by_filter(
-            self._get_correlation_id(req),
+            correlation_id,
             FilterParams(params.get('filter', {})),
             PagingParams.from_value(params.get("paging"))
         )
 
-        if len(page.data) > 0:
-            serealized_items = []
-            for item in page.data:
-                serealized_items.append(item.to_dict())
-
-            page = page.to_json()
-            page['data'] = serealized_items
-
-        return page, self._headers
-
-    def __get_one_by_id(self, req: flask.Request):
-        params = req.get_json()
+        return serialize_page(page), _JSON_HEADERS
 
+    def __get_one_by_id(self, correlation_id: Optional[str], params: dict):
         dummy = self._controller.get_one_by_id(
-            self._get_correlation_id(req),
+            correlation_id,
             params.get('dummy_id')
         )
 
         if dummy:
-            return dummy.to_dict(), self._headers
+            return dummy.to_dict(), _JSON_HEADERS
         else:
             return '', 204
 
-    def __create(self, req: flask.Request):
-        params = req.get_json()
-
+    def __create(self, correlation_id: Optional[str], params: dict):
         dummy = self._controller.create(
-            self._get_correlation_id(req),
-            Dummy(**params.get('dummy'))
+            correlation_id,
+            Dummy.from_dict(params.get('dummy'))
         )
 
-        return dummy.to_dict(), self._headers
-
-    def __update(self, req: flask.Request):
-        params = req.get_json()
+        return dummy.to_dict(), _JSON_HEADERS
 
+    def __update(self, correlation_id: Optional[str], params: dict):
         dummy = self._controller.update(
-            self._get_correlation_id(req),
-            Dummy(**params.get('dummy'))
+            correlation_id,
+            Dummy.from_dict(params.get('dummy'))
         )
 
-        return dummy.to_dict(), self._headers
-
-    def __delete_by_id(self, req: flask.Request):
-        params = req.get_json()
+        return dummy.to_dict(), _JSON_HEADERS
 
+    def __delete_by_id(self, correlation_id: Optional[str], params: dict):
         dummy = self._controller.delete_by_id(
-            self._get_correlation_id(req),
+            correlation_id,
             params.get('dummy_id')
         )
 
         if dummy:
-            return dummy.to_dict(), self._headers
+            return dummy.to_dict(), _JSON_HEADERS
         else:
             return '', 204
 
-    def register(self):
-        self._register_action(
-            'get_dummies',
-            ObjectSchema(True)
-                .with_optional_property('body',
-                                        ObjectSchema(True)
-                                        .with_optional_property('filter', FilterParamsSchema())
-                                        .with_optional_property('paging', PagingParamsSchema())),
-            self.__get_page_by_filter
-        )
+    def __with_context(self, handler: Callable[[Optional[str], dict], Any]) -> Callable[[flask.Request], Any]:
+        # Extracts correlation id and parsed body once and passes them to the handler
+        get_correlation_id = self._get_correlation_id
 
-        self._register_action(
-            'get_dummy_by_id',
-            ObjectSchema(True)
-                .with_optional_property('body',
-                                        ObjectSchema(True)
-                                        .with_optional_property('dummy_id', TypeCode.String)),
-            self.__get_one_by_id
-        )
+        def action(req: flask.Request):
+            return handler(get_correlation_id(req), CloudFunctionRequestHelper.get_body(req))
 
-        self._register_action(
-            'create_dummy',
-            ObjectSchema(True)
-                .with_optional_property('body',
-                                        ObjectSchema(True)
-                                        .with_required_property('dummy', DummySchema())),
-            self.__create
-        )
-
-        self._register_action(
-            'update_dummy',
-            ObjectSchema(True)
-                .with_optional_property('body',
-                                        ObjectSchema(True)
-                                        .with_required_property('dummy', DummySchema())),
-            self.__update
-        )
+        return action
 
-        self._register_action(
-            'delete_dummy',
-            ObjectSchema(True)
-                .with_optional_property('body',
-                                        ObjectSchema(True)
-                                        .with_required_property('dummy_id', TypeCode.String)),
-            self.__delete_by_id
-        )
+    def register(self):
+        self._register_action('get_dummies', _GET_DUMMIES_SCHEMA, self.__with_context(self.__get_page_by_filter))
+        self._register_action('get_dummy_by_id', _GET_DUMMY_BY_ID_SCHEMA, self.__with_context(self.__get_one_by_id))
+        self._register_action('create_dummy', _DUMMY_SCHEMA, self.__with_context(self.__create))
+        self._register_action('update_dummy', _DUMMY_SCHEMA, self.__with_context(self.__update))
+        self._register_action('delete_dummy', _DELETE_DUMMY_SCHEMA, self.__with_context(self.__delete_by_id))
@@ -3,8 +3,10 @@ from pip_services3_commons.refer import Descriptor
 
 from pip_services3_gcp.services import CommandableCloudFunctionService
 
+_CONTROLLER_DESCRIPTOR = Descriptor('pip-services-dummies', 'controller', 'default', '*', '*')
+
 
 class DummyCommandableCloudFunctionService(CommandableCloudFunctionService):
     def __init__(self):
         super(DummyCommandableCloudFunctionService, self).__init__('dummies')
-        self._dependency_resolver.put('controller', Descriptor('pip-services-dummies', 'controller', 'default', '*', '*'))
\ No newline at end of file
+        self._dependency_resolver.put('controller', _CONTROLLER_DESCRIPTOR)
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+import json
+from decimal import Decimal
+
+import flask
+from pip_services3_commons.errors import BadRequestException
+
+from pip_services3_gcp.services import CloudFunctionService
+
+
+class EmptyCloudFunctionService(CloudFunctionService):
+
+    def __init__(self):
+        super().__init__('empty')
+
+    def register(self):
+        pass
+
+
+class InterceptedCloudFunctionService(CloudFunctionService):
+
+    def __init__(self):
+        super().__init__('test')
+        self.calls = []
+
+    def __call(self, name):
+        def action(req):
+            self.calls.append(name)
+            return name
+
+        return action
+
+    def register(self):
+        # Interceptors are called in the order of registration
+        self._register_interceptor('test.b', self.__call('intercept b'))
+        self._register_interceptor('test.', self.__call('intercept all'))
+
+        self._register_action('a', None, self.__call('a'))
+        self._register_action('b', None, self.__call('b'))
+        self._register_action_with_auth('c', None, self.__authorize, self.__call('c'))
+
+    def __authorize(self, req, next):
+        self.calls.append('authorize')
+        if req.headers.get('Authorization') is None:
+            return 'unauthorized'
+        return next(req)
+
+
+app = flask.Flask(__name__)
+
+
+def call_action(action, cmd, headers=None):
+    with app.test_request_context(method='POST', json={'cmd': cmd}, headers=headers):
+        flask.request.view_args = {}
+        return action.action(flask.request)
+
+
+class TestCloudFunctionService:
+
+    def setup_method(self):
+        self.service = EmptyCloudFunctionService()
+
+    def test_compose_error(self):
+        error = BadRequestException('123', 'BAD_REQUEST', 'Bad request')
+        error.details = {'ids': {1: 'x'}, 'tags': {'a'}, 'amount': Decimal('1.5')}
+
+        response = self.service._compose_error(error)
+
+        assert response.status_code == 400
+        assert response.content_type == 'application/json'
+
+        body = json.loads(response.get_data())
+        assert body['code'] == 'BAD_REQUEST'
+        assert body['correlation_id'] == '123'
+        assert body['details'] == {'ids': {'1': 'x'}, 'tags': ['a'], 'amount': '1.5'}
+
+    def test_compose_error_with_big_int(self):
+        error = BadRequestException('123', 'BAD_REQUEST', 'Bad request')
+        error.details = {'id': 2 ** 70, 'ids': {1: 'x'}}
+
+        response = self.service._compose_error(error)
+
+        assert response.status_code == 400
+        assert json.loads(response.get_data())['details'] == {'id': 2 ** 70, 'ids': {'1': 'x'}}
+
+    def test_compose_default_error(self):
+        response = self.service._compose_error(None)
+
+        assert response.status_code == 500
+        assert json.loads(response.get_data())['status'] == 500
+
+    def test_compose_error_stack_trace(self):
+        error = BadRequestException('123', 'BAD_REQUEST', 'Bad request')
+
+        # Outside of exception handling there is no stack trace to format
+        response = self.service._compose_error(error)
+        assert json.loads(response.get_data())['stack_trace'] is None
+
+        try:
+            raise error
+        except BadRequestException as err:
+            response = self.service._compose_error(err)
+
+        stack_trace = json.loads(response.get_data())['stack_trace']
+        assert stack_trace
+        assert 'BadRequestException' in stack_trace
+
+
+class TestCloudFunctionServiceInterceptors:
+
+    def setup_method(self):
+        self.service = InterceptedCloudFunctionService()
+        self.service.open(None)
+
+    def teardown_method(self):
+        self.service.close(None)
+
+    def test_get_action(self):
+        actions = self.service.get_actions()
+
+        assert [action.cmd for action in actions] == ['test.a', 'test.b', 'test.c']
+        assert self.service.get_action('test.a') is actions[0]
+        assert self.service.get_action('test.b') is actions[1]
+        assert self.service.get_action('test.c') is actions[2]
+        assert self.service.get_action('test.d') is None
+
+    def test_close(self):
+        actions = self.service.get_actions()
+        assert len(actions) == 3
+
+        self.service.close(None)
+
+        # The list returned before is cleared in place
+        assert actions == []
+        assert self.service.get_actions() is actions
+        assert self.service.get_action('test.a') is None
+
+    def test_interceptors(self):
+        action_a = self.service.get_action('test.a')
+        action_b = self.service.get_action('test.b')
+
+        # The first matching interceptor handles the request
+        assert call_action(action_b, 'test.b') == 'intercept b'
+        assert call_action(action_a, 'test.a') == 'intercept all'
+        # Requests that do not match any interceptor reach the action
+        assert call_action(action_a, 'other') == 'a'
+
+        assert self.service.calls == ['intercept b', 'intercept all', 'a']
+
+    def test_action_with_auth(self):
+        action_c = self.service.get_action('test.c')
+
+        assert call_action(action_c, 'other') == 'unauthorized'
+        assert call_action(action_c, 'other', {'Authorization': 'token'}) == 'c'
+        # Interceptors are called before authorization
+        assert call_action(action_c, 'test.c', {'Authorization': 'token'}) == 'intercept all'
+
+        assert self.service.calls == ['authorize', 'authorize', 'c', 'intercept all']